@@ -0,0 +1,698 @@
+#!/usr/bin/env python3
+"""
+PCIe Open-Loop Load Generator
+
+This script drives sustained, seed-reproducible configuration and memory
+traffic into the Xilinx PCIe simulation through PCIeSimInterface. Unlike
+demo_sequence() and pcie_test_example.py, commands are issued on a fixed
+schedule at a target offered rate without waiting for earlier completions
+(open loop), so queueing in the pipe path and the simulator becomes visible.
+
+Usage:
+    python3 pcie_loadgen.py --rate 500 --duration 3600
+    python3 pcie_loadgen.py --rate 2000 --write-ratio 0.3 --burst 1:4,8:1
+    python3 pcie_loadgen.py --region 10000000:800 --dist hotspot --seed 7
+    python3 pcie_loadgen.py --dry-run 20
+
+Every window the generator prints offered vs. achieved rate, backlog,
+outstanding tags, tag-space stalls, latency percentiles with drift against
+the first window, error/timeout/miscompare counts and process RSS. A tag
+whose transaction timed out is held back until the simulator's late
+response for it arrives, so it can never complete a newer transaction;
+that late response still counts toward achieved rate and latency.
+
+Memory writes are mirrored into a shadow copy and every memory read of a
+previously written address is checked against it. Config traffic reads
+read-only header registers (checked against a snapshot taken at startup)
+and rewrites the Command register with its startup value. Only the low 16
+bits are written back: the upper half of the dword is the Status register,
+whose write-1-to-clear error bits must not be cleared by the rewrite.
+
+Note: the simulator completes one DW per command and ignores the length
+field, so a burst of N is issued as N back-to-back single-DW commands to
+consecutive addresses.
+"""
+
+import argparse
+import math
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from pcie_sim_interface import PCIeSimInterface, PCIeCommand
+
+CMD_CFG_READ = 0x01
+CMD_CFG_WRITE = 0x02
+CMD_MEM_READ = 0x03
+CMD_MEM_WRITE = 0x04
+
+CMD_NAMES = {
+    CMD_CFG_READ: "CfgRd",
+    CMD_CFG_WRITE: "CfgWr",
+    CMD_MEM_READ: "MemRd",
+    CMD_MEM_WRITE: "MemWr",
+}
+
+# Read-only type 0 header registers: Device/Vendor ID, Class Code/Revision ID,
+# Subsystem ID/Subsystem Vendor ID
+CFG_READ_REGS = (0x00, 0x08, 0x2C)
+CFG_COMMAND_REG = 0x04
+
+# The pipe protocol carries an 8-bit tag
+TAG_SPACE = 256
+
+# PIO example design memory per BAR (64 x 256-bit entries)
+DEFAULT_REGION_SIZE = 0x800
+
+
+@dataclass
+class Region:
+    """Memory region targeted by generated traffic"""
+    base: int
+    size: int
+    weight: float = 1.0
+
+
+@dataclass
+class LoadProfile:
+    """Traffic mix and run parameters"""
+    rate: float = 100.0
+    duration: float = 60.0
+    window: float = 10.0
+    seed: int = 1
+    arrival: str = "constant"
+    cfg_ratio: float = 0.05
+    write_ratio: float = 0.5
+    bursts: List[Tuple[int, float]] = field(default_factory=lambda: [(1, 1.0)])
+    dist: str = "uniform"
+    hotspot_fraction: float = 0.1
+    hotspot_weight: float = 0.9
+    max_outstanding: int = TAG_SPACE
+    max_backlog: int = 100000
+    timeout: float = 5.0
+
+
+@dataclass
+class Transaction:
+    """Single generated command and its bookkeeping"""
+    cmd_type: int
+    address: int
+    data: int = 0
+    scheduled: float = 0.0
+    issued: float = 0.0
+    tag: int = 0
+    expected: Optional[int] = None
+
+
+class TrafficGenerator:
+    """Seed-reproducible stream of config and memory transactions
+
+    The stream depends only on the profile, the regions and the seed, never
+    on timing or on responses, so two runs with the same arguments offer
+    identical traffic.
+    """
+
+    def __init__(self, profile: LoadProfile, regions: List[Region]):
+        max_burst = max(b[0] for b in profile.bursts)
+        for region in regions:
+            if max_burst > region.size // 4:
+                raise ValueError(f"burst of {max_burst} DWs does not fit region "
+                                 f"0x{region.base:08x} + 0x{region.size:x}")
+
+        self.profile = profile
+        self.regions = regions
+        self.rng = random.Random(profile.seed)
+        self.region_weights = [r.weight for r in regions]
+        self.burst_sizes = [b[0] for b in profile.bursts]
+        self.burst_weights = [b[1] for b in profile.bursts]
+        self.seq_offsets = [0] * len(regions)
+
+    def _pick_offset(self, index: int, burst: int) -> int:
+        """Pick a DW-aligned offset in a region so the whole burst fits"""
+        region = self.regions[index]
+        slots = region.size // 4 - burst + 1
+
+        if self.profile.dist == "sequential":
+            # Sweep the whole region, wrapping early only when the burst
+            # would run past its end
+            dwords = region.size // 4
+            slot = self.seq_offsets[index]
+            if slot + burst > dwords:
+                slot = 0
+            self.seq_offsets[index] = (slot + burst) % dwords
+        elif self.profile.dist == "hotspot":
+            hot_slots = max(int(slots * self.profile.hotspot_fraction), 1)
+            if self.rng.random() < self.profile.hotspot_weight:
+                slot = self.rng.randrange(hot_slots)
+            else:
+                slot = self.rng.randrange(slots)
+        else:
+            slot = self.rng.randrange(slots)
+
+        return slot * 4
+
+    def next_burst(self) -> List[Transaction]:
+        """Generate the next burst of transactions"""
+        is_write = self.rng.random() < self.profile.write_ratio
+
+        if self.rng.random() < self.profile.cfg_ratio:
+            if is_write:
+                return [Transaction(CMD_CFG_WRITE, CFG_COMMAND_REG)]
+            return [Transaction(CMD_CFG_READ, self.rng.choice(CFG_READ_REGS))]
+
+        burst = self.rng.choices(self.burst_sizes, self.burst_weights)[0]
+        index = self.rng.choices(range(len(self.regions)), self.region_weights)[0]
+        address = self.regions[index].base + self._pick_offset(index, burst)
+
+        txns = []
+        for i in range(burst):
+            if is_write:
+                txns.append(Transaction(CMD_MEM_WRITE, address + i * 4,
+                                        data=self.rng.getrandbits(32)))
+            else:
+                txns.append(Transaction(CMD_MEM_READ, address + i * 4))
+        return txns
+
+
+@dataclass
+class WindowStats:
+    """Counters for one reporting window"""
+    start: float
+    offered: int = 0
+    issued: int = 0
+    completed: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    miscompares: int = 0
+    late: int = 0
+    stale: int = 0
+    dropped: int = 0
+    tag_stalls: int = 0
+    tag_stall_time: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+    queue_delays: List[float] = field(default_factory=list)
+
+
+def generates_cfg_writes(profile: LoadProfile) -> bool:
+    """Whether the profile can produce Command register rewrites"""
+    return profile.cfg_ratio > 0 and profile.write_ratio > 0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class LoadGenerator:
+    """Open-loop driver for PCIeSimInterface"""
+
+    def __init__(self, sim: PCIeSimInterface, profile: LoadProfile,
+                 regions: List[Region], cfg_snapshot: Dict[int, int]):
+        if generates_cfg_writes(profile) and CFG_COMMAND_REG not in cfg_snapshot:
+            raise ValueError("config writes need a snapshot of the Command register")
+
+        self.sim = sim
+        self.profile = profile
+        self.generator = TrafficGenerator(profile, regions)
+        self.arrival_rng = random.Random(profile.seed + 1)
+        self.cfg_snapshot = cfg_snapshot
+
+        self.lock = threading.Lock()
+        self.free_tags = deque(range(min(profile.max_outstanding, TAG_SPACE)))
+        self.outstanding: Dict[int, Transaction] = {}
+        # Timed-out transactions keep their tag until the simulator's late
+        # response arrives, otherwise it would complete a reused tag
+        self.quarantined: Dict[int, Transaction] = {}
+        self.shadow: Dict[int, int] = {}
+        self.backlog: deque = deque()
+
+        self.running = False
+        self.sim_lost = False
+        self.collector_thread = None
+        self.window: Optional[WindowStats] = None
+        self.totals = WindowStats(start=0.0)
+        self.baseline_p50: Optional[float] = None
+        self.start_rss = current_rss()
+
+    def _collector(self):
+        """Background thread matching responses to outstanding tags"""
+        while self.running:
+            try:
+                response = self.sim.response_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            self._handle_response(response, time.monotonic())
+
+    def _handle_response(self, response, now: float):
+        """Match one response to its outstanding or quarantined tag"""
+        with self.lock:
+            txn = self.outstanding.pop(response.tag, None)
+            if txn is not None:
+                self.free_tags.append(response.tag)
+                self._complete(txn, response, now)
+                return
+
+            txn = self.quarantined.pop(response.tag, None)
+            if txn is not None:
+                # Already counted as a timeout, but it did complete; keep its
+                # latency so overload shows up in the window instead of vanishing
+                self.free_tags.append(response.tag)
+                self._count("late")
+                self._complete(txn, response, now)
+            else:
+                self._count("stale")
+
+    def _count(self, name: str, amount=1):
+        """Bump a counter in both the current window and the run totals"""
+        setattr(self.window, name, getattr(self.window, name) + amount)
+        setattr(self.totals, name, getattr(self.totals, name) + amount)
+
+    def _complete(self, txn: Transaction, response, now: float):
+        """Account for a finished transaction (called with lock held)"""
+        self._count("completed")
+        self.window.latencies.append(now - txn.issued)
+
+        if response.status != 0 or response.rsp_type != txn.cmd_type:
+            self._count("errors")
+            if txn.cmd_type == CMD_MEM_WRITE:
+                self.shadow.pop(txn.address, None)
+            return
+
+        if txn.expected is not None and response.read_data != txn.expected:
+            self._count("miscompares")
+            print(f"✗ {CMD_NAMES[txn.cmd_type]} [0x{txn.address:08x}] "
+                  f"read 0x{response.read_data:08x}, expected 0x{txn.expected:08x}")
+
+    def _issue(self, txn: Transaction, now: float) -> bool:
+        """Send one transaction (called with lock held and a free tag)"""
+        txn.tag = self.free_tags.popleft()
+        txn.issued = now
+
+        if txn.cmd_type == CMD_MEM_READ:
+            txn.expected = self.shadow.get(txn.address)
+        elif txn.cmd_type == CMD_CFG_WRITE:
+            txn.data = self.cfg_snapshot[CFG_COMMAND_REG] & 0xFFFF
+        elif txn.cmd_type == CMD_CFG_READ:
+            txn.expected = self.cfg_snapshot.get(txn.address)
+
+        self.outstanding[txn.tag] = txn
+        cmd = PCIeCommand(cmd_type=txn.cmd_type, address=txn.address,
+                          data=txn.data, tag=txn.tag)
+        if not self.sim._send_command(cmd):
+            del self.outstanding[txn.tag]
+            self.free_tags.append(txn.tag)
+            self._count("errors")
+            self.sim_lost = True
+            return False
+
+        if txn.cmd_type == CMD_MEM_WRITE:
+            self.shadow[txn.address] = txn.data
+        self._count("issued")
+        self.window.queue_delays.append(now - txn.scheduled)
+        return True
+
+    def _expire(self, now: float):
+        """Retire transactions that outlived the response timeout"""
+        with self.lock:
+            expired = [tag for tag, txn in self.outstanding.items()
+                       if now - txn.issued > self.profile.timeout]
+            for tag in expired:
+                txn = self.outstanding.pop(tag)
+                self.quarantined[tag] = txn
+                self._count("timeouts")
+                if txn.cmd_type == CMD_MEM_WRITE:
+                    self.shadow.pop(txn.address, None)
+
+    def _next_gap(self, burst: int) -> float:
+        """Time until the next arrival given the size of the current one"""
+        mean = burst / self.profile.rate
+        if self.profile.arrival == "poisson":
+            return self.arrival_rng.expovariate(1.0 / mean)
+        return mean
+
+    def _report(self, now: float, run_start: float):
+        """Print a summary line for the window ending now"""
+        w = self.window
+        span = max(now - w.start, 1e-9)
+        qdelay = sum(w.queue_delays) / len(w.queue_delays) if w.queue_delays else 0.0
+
+        if w.latencies:
+            p50 = percentile(w.latencies, 50)
+            if self.baseline_p50 is None:
+                self.baseline_p50 = p50
+            drift = ((p50 - self.baseline_p50) / self.baseline_p50 * 100.0
+                     if self.baseline_p50 else 0.0)
+            latency = (f"lat p50 {p50 * 1e3:.3f}ms p99 {percentile(w.latencies, 99) * 1e3:.3f}ms "
+                       f"max {max(w.latencies) * 1e3:.3f}ms drift {drift:+.1f}%")
+        else:
+            latency = "lat n/a drift n/a"
+
+        rss = current_rss()
+        print(f"[{now - run_start:8.1f}s] "
+              f"offered {w.offered / span:8.1f}/s achieved {w.completed / span:8.1f}/s | "
+              f"backlog {len(self.backlog)} outst {len(self.outstanding)} "
+              f"quar {len(self.quarantined)} dropped {w.dropped} | "
+              f"tag-stall {w.tag_stalls} ({w.tag_stall_time:.2f}s) | "
+              f"{latency} qdelay {qdelay * 1e3:.3f}ms | "
+              f"err {w.errors} tmo {w.timeouts} miscompare {w.miscompares} "
+              f"late {w.late} stale {w.stale} | "
+              f"rss {rss / 2**20:.1f}MB ({(rss - self.start_rss) / 2**20:+.1f})")
+
+    def run(self) -> bool:
+        """Run the load for the profile duration; returns True if clean"""
+        profile = self.profile
+        run_start = time.monotonic()
+        run_end = run_start + profile.duration
+        self.window = WindowStats(start=run_start)
+        self.totals.start = run_start
+
+        self.running = True
+        self.collector_thread = threading.Thread(target=self._collector, daemon=True)
+        self.collector_thread.start()
+
+        next_arrival = run_start
+        stall_start = None
+
+        try:
+            while True:
+                now = time.monotonic()
+                if now >= run_end:
+                    break
+
+                # Admit every arrival that is due, independent of completions
+                while next_arrival <= now:
+                    burst = self.generator.next_burst()
+                    for txn in burst:
+                        txn.scheduled = next_arrival
+                        self._count("offered")
+                        if len(self.backlog) < profile.max_backlog:
+                            self.backlog.append(txn)
+                        else:
+                            self._count("dropped")
+                    next_arrival += self._next_gap(len(burst))
+
+                with self.lock:
+                    while self.backlog and self.free_tags and not self.sim_lost:
+                        self._issue(self.backlog.popleft(), now)
+                    tags_exhausted = bool(self.backlog) and not self.free_tags
+
+                if self.sim_lost:
+                    print("\n✗ Simulation stopped accepting commands, ending load")
+                    break
+
+                if tags_exhausted and stall_start is None:
+                    stall_start = now
+                    self._count("tag_stalls")
+                elif not tags_exhausted and stall_start is not None:
+                    self._count("tag_stall_time", now - stall_start)
+                    stall_start = None
+
+                self._expire(now)
+
+                if now - self.window.start >= profile.window:
+                    with self.lock:
+                        if stall_start is not None:
+                            self._count("tag_stall_time", now - stall_start)
+                            stall_start = now
+                        self._report(now, run_start)
+                        self.window = WindowStats(start=now)
+
+                wake = min(next_arrival, self.window.start + profile.window, run_end)
+                if tags_exhausted:
+                    wake = min(wake, now + 0.001)
+                delay = wake - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+        except KeyboardInterrupt:
+            print("\nLoad interrupted by user")
+
+        load_end = time.monotonic()
+
+        # Stop offering load and give in-flight transactions a chance to
+        # finish; a second interrupt abandons them but still prints the summary
+        try:
+            with self.lock:
+                if stall_start is not None:
+                    self._count("tag_stall_time", load_end - stall_start)
+                self._report(load_end, run_start)
+                self.window = WindowStats(start=load_end)
+
+            drain_end = time.monotonic() + profile.timeout
+            while ((self.outstanding or self.quarantined)
+                   and time.monotonic() < drain_end):
+                time.sleep(0.01)
+            self.running = False
+            self.collector_thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            print("\nDrain interrupted by user, abandoning in-flight transactions")
+            self.running = False
+        self._expire(float("inf"))
+
+        return self._summary(load_end - run_start)
+
+    def _summary(self, elapsed: float) -> bool:
+        """Print run totals over the load period; returns True if no errors were seen"""
+        t = self.totals
+        print("\n=== Load Summary ===")
+        print(f"Elapsed:       {elapsed:.1f}s")
+        print(f"Offered:       {t.offered} ({t.offered / elapsed:.1f}/s)")
+        print(f"Issued:        {t.issued}")
+        print(f"Completed:     {t.completed} ({t.completed / elapsed:.1f}/s)")
+        print(f"Unissued:      {len(self.backlog)} left in backlog, {t.dropped} dropped")
+        print(f"Tag stalls:    {t.tag_stalls} ({t.tag_stall_time:.2f}s)")
+        print(f"Errors:        {t.errors}")
+        print(f"Timeouts:      {t.timeouts}")
+        print(f"Miscompares:   {t.miscompares}")
+        print(f"Late:          {t.late} ({len(self.quarantined)} never answered)")
+        print(f"Stale:         {t.stale}")
+        print(f"Shadow size:   {len(self.shadow)} DWs")
+
+        clean = t.errors == 0 and t.timeouts == 0 and t.miscompares == 0
+        print("✓ Load run clean" if clean else "✗ Load run saw failures")
+        return clean
+
+
+def parse_bursts(spec: str) -> List[Tuple[int, float]]:
+    """Parse 'SIZE[:WEIGHT],...' into (size, weight) pairs"""
+    bursts = []
+    for item in spec.split(','):
+        parts = item.split(':')
+        try:
+            size = int(parts[0], 0)
+            weight = float(parts[1]) if len(parts) > 1 else 1.0
+        except (ValueError, IndexError):
+            raise argparse.ArgumentTypeError(f"burst must be SIZE[:WEIGHT]: {item}")
+        if len(parts) > 2 or size < 1 or not weight > 0:
+            raise argparse.ArgumentTypeError(
+                f"burst needs size >= 1 and weight > 0: {item}")
+        bursts.append((size, weight))
+    return bursts
+
+
+def parse_region(spec: str) -> Region:
+    """Parse 'BASE:SIZE[:WEIGHT]' (hex base and size) into a Region"""
+    parts = spec.split(':')
+    if len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError(f"region must be BASE:SIZE[:WEIGHT]: {spec}")
+    try:
+        base = int(parts[0], 16) & ~0x3
+        size = int(parts[1], 16)
+        weight = float(parts[2]) if len(parts) == 3 else 1.0
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"region must be BASE:SIZE[:WEIGHT]: {spec}")
+    if size < 4 or not weight > 0:
+        raise argparse.ArgumentTypeError(
+            f"region needs size >= 0x4 and weight > 0: {spec}")
+    return Region(base=base, size=size, weight=weight)
+
+
+def parse_bars(spec: str) -> List[int]:
+    """Parse a comma separated list of BAR numbers"""
+    try:
+        bars = [int(b) for b in spec.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"BARs must be integers: {spec}")
+    if any(bar < 0 or bar > 5 for bar in bars):
+        raise argparse.ArgumentTypeError(f"BARs must be in 0-5: {spec}")
+    return bars
+
+
+def validate_args(parser: argparse.ArgumentParser, args):
+    """Reject option values the load loop cannot run with"""
+    for name in ('rate', 'duration', 'window', 'timeout'):
+        if not getattr(args, name) > 0:
+            parser.error(f"--{name} must be > 0")
+    for name in ('cfg_ratio', 'write_ratio', 'hotspot_weight'):
+        if not 0 <= getattr(args, name) <= 1:
+            parser.error(f"--{name.replace('_', '-')} must be in [0, 1]")
+    if not 0 < args.hotspot_fraction <= 1:
+        parser.error("--hotspot-fraction must be in (0, 1]")
+    if not 1 <= args.max_outstanding <= TAG_SPACE:
+        parser.error(f"--max-outstanding must be in 1-{TAG_SPACE}")
+    if args.max_backlog < 1:
+        parser.error("--max-backlog must be >= 1")
+    if args.dry_run is not None and args.dry_run < 0:
+        parser.error("--dry-run must be >= 0")
+
+    max_burst = max(b[0] for b in args.burst)
+    sizes = [r.size for r in args.region] if args.region else [args.bar_size]
+    if max_burst > min(sizes) // 4:
+        parser.error(f"--burst of {max_burst} DWs does not fit a region of "
+                     f"0x{min(sizes):x} bytes")
+
+
+def discover_regions(sim: PCIeSimInterface, bars: List[int], size: int) -> List[Region]:
+    """Build regions from the memory BARs programmed by the testbench"""
+    regions = []
+    for bar in bars:
+        value = sim.config_read(0x10 + bar * 4)
+        if value is None or (value & 0x1) or (value & 0xFFFFFFF0) == 0:
+            print(f"✗ BAR{bar} is not a configured memory BAR")
+            continue
+        regions.append(Region(base=value & 0xFFFFFFF0, size=size))
+    return regions
+
+
+def snapshot_config(sim: PCIeSimInterface) -> Dict[int, int]:
+    """Read the registers config traffic will check or rewrite"""
+    snapshot = {}
+    for reg in CFG_READ_REGS + (CFG_COMMAND_REG,):
+        value = sim.config_read(reg)
+        if value is None:
+            print(f"✗ Config snapshot of register 0x{reg:02x} failed")
+        else:
+            snapshot[reg] = value
+    return snapshot
+
+
+def dry_run(profile: LoadProfile, regions: List[Region], count: int):
+    """Print the first transactions the profile would generate"""
+    generator = TrafficGenerator(profile, regions)
+    printed = 0
+    while printed < count:
+        for txn in generator.next_burst():
+            if printed >= count:
+                break
+            data = f" = 0x{txn.data:08x}" if txn.cmd_type == CMD_MEM_WRITE else ""
+            print(f"{printed:6d} {CMD_NAMES[txn.cmd_type]} [0x{txn.address:08x}]{data}")
+            printed += 1
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Open-loop PCIe traffic generator")
+    parser.add_argument('--rate', type=float, default=100.0,
+                        help="offered load in DW transactions per second")
+    parser.add_argument('--duration', type=float, default=60.0,
+                        help="run time in seconds")
+    parser.add_argument('--window', type=float, default=10.0,
+                        help="summary window in seconds")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--arrival', choices=['constant', 'poisson'], default='constant')
+    parser.add_argument('--cfg-ratio', type=float, default=0.05,
+                        help="fraction of bursts that are config accesses")
+    parser.add_argument('--write-ratio', type=float, default=0.5,
+                        help="fraction of bursts that are writes")
+    parser.add_argument('--burst', type=parse_bursts, default=[(1, 1.0)],
+                        help="burst sizes in DWs with weights, e.g. 1:4,8:1")
+    parser.add_argument('--dist', choices=['uniform', 'sequential', 'hotspot'],
+                        default='uniform', help="address distribution within a region")
+    parser.add_argument('--hotspot-fraction', type=float, default=0.1)
+    parser.add_argument('--hotspot-weight', type=float, default=0.9)
+    parser.add_argument('--bars', type=parse_bars, default=[0],
+                        help="comma separated memory BARs to target")
+    parser.add_argument('--bar-size', type=lambda s: int(s, 16), default=DEFAULT_REGION_SIZE,
+                        help="bytes of each BAR to target (hex)")
+    parser.add_argument('--region', type=parse_region, action='append',
+                        help="explicit BASE:SIZE[:WEIGHT] region (hex), overrides --bars")
+    parser.add_argument('--max-outstanding', type=int, default=TAG_SPACE)
+    parser.add_argument('--max-backlog', type=int, default=100000)
+    parser.add_argument('--timeout', type=float, default=5.0,
+                        help="per-transaction response timeout in seconds")
+    parser.add_argument('--dry-run', type=int, metavar='N',
+                        help="print the first N generated transactions and exit")
+    parser.add_argument('--terminate', action='store_true',
+                        help="terminate the simulation when the run finishes")
+    args = parser.parse_args()
+    validate_args(parser, args)
+
+    profile = LoadProfile(
+        rate=args.rate, duration=args.duration, window=args.window, seed=args.seed,
+        arrival=args.arrival, cfg_ratio=args.cfg_ratio, write_ratio=args.write_ratio,
+        bursts=args.burst, dist=args.dist, hotspot_fraction=args.hotspot_fraction,
+        hotspot_weight=args.hotspot_weight, max_outstanding=args.max_outstanding,
+        max_backlog=args.max_backlog, timeout=args.timeout,
+    )
+
+    if args.dry_run is not None:
+        regions = args.region or [Region(base=0x10000000, size=args.bar_size)]
+        dry_run(profile, regions, args.dry_run)
+        return 0
+
+    sim = PCIeSimInterface()
+    if not sim.connect():
+        print("Failed to connect to simulation. Make sure the simulation is running.")
+        return 1
+
+    try:
+        if sim.get_link_status() is None:
+            print("Failed to get link status")
+            return 1
+
+        regions = args.region or discover_regions(
+            sim, args.bars, args.bar_size)
+        if not regions:
+            print("No memory regions to target")
+            return 1
+
+        cfg_snapshot = snapshot_config(sim)
+        if generates_cfg_writes(profile) and CFG_COMMAND_REG not in cfg_snapshot:
+            print("Refusing to rewrite the Command register without its startup value; "
+                  "use --cfg-ratio 0 or --write-ratio 0 to skip config writes")
+            return 1
+
+        print(f"\n=== Open-Loop Load: {profile.rate:.1f}/s for {profile.duration:.0f}s, "
+              f"seed {profile.seed} ===")
+        for region in regions:
+            print(f"  Region 0x{region.base:08x} + 0x{region.size:x} (weight {region.weight})")
+
+        generator = LoadGenerator(sim, profile, regions, cfg_snapshot)
+        clean = generator.run()
+
+        if args.terminate and not generator.sim_lost:
+            sim.terminate_simulation()
+    except KeyboardInterrupt:
+        print("\nLoad setup interrupted by user")
+        return 1
+    finally:
+        try:
+            sim.disconnect()
+        except OSError as e:
+            print(f"Error disconnecting: {e}")
+
+    return 0 if clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Checks for the open-loop load generator that run without a simulation
+"""
+
+import argparse
+import io
+import queue
+import subprocess
+import sys
+from contextlib import redirect_stdout
+
+sys.path.append('.')
+
+from pcie_sim_interface import PCIeResponse
+from pcie_loadgen import (
+    CFG_COMMAND_REG, CFG_READ_REGS, CMD_CFG_READ, CMD_CFG_WRITE, CMD_MEM_READ, CMD_MEM_WRITE,
+    LoadGenerator, LoadProfile, Region, TrafficGenerator, Transaction,
+    WindowStats, dry_run, parse_bursts, percentile,
+)
+
+
+class FakeSim:
+    """Stands in for PCIeSimInterface, recording commands instead of sending them"""
+
+    def __init__(self):
+        self.response_queue = queue.Queue()
+        self.sent = []
+
+    def _send_command(self, cmd) -> bool:
+        self.sent.append(cmd)
+        return True
+
+
+def dry_run_output(profile, regions, count=500) -> str:
+    """Capture the dry-run listing of a profile"""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        dry_run(profile, regions, count)
+    return out.getvalue()
+
+
+def test_seed_reproducible():
+    """Same seed gives the same stream, a different seed does not"""
+    print("Testing seed reproducibility...")
+    regions = [Region(0x10000000, 0x800), Region(0x20000000, 0x100, 2.0)]
+    bursts = [(1, 3.0), (4, 1.0)]
+
+    first = dry_run_output(LoadProfile(seed=5, bursts=bursts, dist="hotspot"), regions)
+    second = dry_run_output(LoadProfile(seed=5, bursts=bursts, dist="hotspot"), regions)
+    other = dry_run_output(LoadProfile(seed=6, bursts=bursts, dist="hotspot"), regions)
+    assert first == second
+    assert first != other
+
+    cmd = [sys.executable, "pcie_loadgen.py", "--dry-run", "200", "--seed", "9",
+           "--burst", "1:2,8:1", "--dist", "sequential"]
+    runs = [subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            for _ in range(2)]
+    assert runs[0] == runs[1] and runs[0].count("\n") == 200
+    print("✓ Traffic is reproducible from the seed")
+
+
+def test_address_bounds():
+    """Every distribution keeps bursts adjacent, aligned and inside their region"""
+    print("Testing address bounds...")
+    regions = [Region(0x10000000, 0x800), Region(0x10001000, 0x40)]
+
+    for dist in ("uniform", "sequential", "hotspot"):
+        profile = LoadProfile(seed=3, dist=dist, cfg_ratio=0.1,
+                              bursts=[(1, 1.0), (4, 1.0), (16, 1.0)])
+        generator = TrafficGenerator(profile, regions)
+        for _ in range(5000):
+            burst = generator.next_burst()
+            first = burst[0]
+            if first.cmd_type in (CMD_CFG_READ, CMD_CFG_WRITE):
+                assert len(burst) == 1
+                assert first.address in CFG_READ_REGS + (CFG_COMMAND_REG,)
+                continue
+
+            assert len({txn.cmd_type for txn in burst}) == 1
+            assert first.address % 4 == 0
+            for i, txn in enumerate(burst):
+                assert txn.address == first.address + i * 4
+            assert any(r.base <= first.address and
+                       burst[-1].address + 4 <= r.base + r.size for r in regions)
+
+    try:
+        TrafficGenerator(LoadProfile(bursts=[(32, 1.0)]), [Region(0x1000, 0x40)])
+        assert False, "oversized burst accepted"
+    except ValueError:
+        pass
+    print("✓ Addresses stay inside their regions for every distribution")
+
+
+def test_sequential_sweep():
+    """Sequential bursts of mixed sizes follow each other until the region wraps"""
+    print("Testing sequential sweep...")
+    region = Region(0x10000000, 0x100)
+    profile = LoadProfile(seed=4, dist="sequential", cfg_ratio=0.0,
+                          bursts=[(1, 2.0), (8, 1.0)])
+    generator = TrafficGenerator(profile, [region])
+
+    cursor = region.base
+    for _ in range(2000):
+        burst = generator.next_burst()
+        if burst[0].address != cursor:
+            assert burst[0].address == region.base
+            assert cursor + len(burst) * 4 > region.base + region.size
+        cursor = burst[-1].address + 4
+        if cursor == region.base + region.size:
+            cursor = region.base
+    print("✓ Sequential distribution sweeps the region in order")
+
+
+def test_percentile():
+    """Nearest-rank percentiles"""
+    print("Testing percentile...")
+    assert percentile([], 50) == 0.0
+    assert percentile([2.0, 1.0], 50) == 1.0
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile(list(range(1, 101)), 100) == 100
+    assert percentile([5.0], 0) == 5.0
+    print("✓ Percentiles use nearest rank")
+
+
+def test_argument_validation():
+    """Bad option values are rejected instead of crashing or hanging"""
+    print("Testing argument validation...")
+    for spec in ("1:0", "0", "x", "1:-1"):
+        try:
+            parse_bursts(spec)
+            assert False, f"burst spec {spec} accepted"
+        except argparse.ArgumentTypeError:
+            pass
+
+    for args in (["--burst", "1:0"], ["--rate", "0"], ["--rate", "-1"],
+                 ["--max-outstanding", "0"], ["--window", "0"], ["--bars", "7"],
+                 ["--region", "1000:20", "--burst", "16"]):
+        result = subprocess.run([sys.executable, "pcie_loadgen.py", "--dry-run", "3"] + args,
+                                capture_output=True, text=True, timeout=30)
+        assert result.returncode == 2, args
+        assert "Traceback" not in result.stderr, args
+    print("✓ Invalid arguments are rejected")
+
+
+def test_cfg_write_needs_snapshot():
+    """Config writes are refused without a Command register snapshot"""
+    print("Testing Command register guard...")
+    regions = [Region(0x10000000, 0x800)]
+    try:
+        LoadGenerator(FakeSim(), LoadProfile(cfg_ratio=0.5), regions, {0x00: 0x903410EE})
+        assert False, "config writes allowed without a snapshot"
+    except ValueError:
+        pass
+
+    LoadGenerator(FakeSim(), LoadProfile(cfg_ratio=0.5, write_ratio=0.0), regions, {})
+
+    # Status bits in the upper half are write-1-to-clear and must be written as 0
+    sim = FakeSim()
+    gen = LoadGenerator(sim, LoadProfile(cfg_ratio=0.5), regions,
+                        {CFG_COMMAND_REG: 0x20100007})
+    gen.window = WindowStats(start=0.0)
+    with gen.lock:
+        gen._issue(Transaction(CMD_CFG_WRITE, CFG_COMMAND_REG), now=0.0)
+    assert sim.sent[-1].data == 0x0007
+    print("✓ Command register is never rewritten blindly")
+
+
+def test_timed_out_tag_not_reused():
+    """A late response must not complete the transaction that reused its tag"""
+    print("Testing tag quarantine after timeout...")
+    sim = FakeSim()
+    profile = LoadProfile(cfg_ratio=0.0, max_outstanding=2, timeout=0.1)
+    gen = LoadGenerator(sim, profile, [Region(0x10000000, 0x800)], {})
+    gen.window = WindowStats(start=0.0)
+    addr = 0x10000000
+    gen.shadow[addr] = 0x11111111
+
+    with gen.lock:
+        gen._issue(Transaction(CMD_MEM_READ, addr), now=0.0)
+    old_tag = sim.sent[-1].tag
+    gen._expire(now=1.0)
+    assert gen.totals.timeouts == 1
+    assert old_tag in gen.quarantined and old_tag not in gen.free_tags
+
+    # The next transaction reads a newer value and must get a different tag
+    gen.shadow[addr] = 0x22222222
+    with gen.lock:
+        gen._issue(Transaction(CMD_MEM_READ, addr), now=1.0)
+    new_tag = sim.sent[-1].tag
+    assert new_tag != old_tag
+    assert not gen.free_tags
+
+    # The simulator answers in order: first the late response, then the new one
+    gen._handle_response(PCIeResponse(CMD_MEM_READ, 0x11111111, old_tag, 0, 0), now=1.1)
+    gen._handle_response(PCIeResponse(CMD_MEM_READ, 0x22222222, new_tag, 0, 0), now=1.2)
+
+    t = gen.totals
+    assert (t.late, t.completed, t.errors, t.miscompares, t.stale) == (1, 2, 0, 0, 0)
+    assert sorted(gen.free_tags) == [0, 1] and not gen.quarantined
+    print("✓ Timed-out tags stay quarantined until their late response")
+
+
+def test_late_response_latency_recorded():
+    """A late response still counts as completed with its full latency"""
+    print("Testing late response accounting...")
+    sim = FakeSim()
+    profile = LoadProfile(cfg_ratio=0.0, timeout=1.0)
+    gen = LoadGenerator(sim, profile, [Region(0x10000000, 0x800)], {})
+    gen.window = WindowStats(start=0.0)
+
+    with gen.lock:
+        gen._issue(Transaction(CMD_MEM_READ, 0x10000000), now=10.0)
+    tag = sim.sent[-1].tag
+    gen._expire(now=12.0)
+    gen.window = WindowStats(start=12.0)
+
+    gen._handle_response(PCIeResponse(CMD_MEM_READ, 0, tag, 0, 0), now=13.5)
+    assert gen.window.latencies == [3.5]
+    assert (gen.window.completed, gen.window.late) == (1, 1)
+    assert gen.totals.completed == 1
+    print("✓ Late responses keep their latency")
+
+
+def test_failed_write_leaves_shadow():
+    """A write that never reached the simulator must not update the shadow copy"""
+    print("Testing shadow copy on send failure...")
+    sim = FakeSim()
+    sim._send_command = lambda cmd: False
+    gen = LoadGenerator(sim, LoadProfile(cfg_ratio=0.0), [Region(0x10000000, 0x800)], {})
+    gen.window = WindowStats(start=0.0)
+    gen.shadow[0x10000000] = 0x11111111
+
+    with gen.lock:
+        assert not gen._issue(Transaction(CMD_MEM_WRITE, 0x10000000, 0x22222222), now=0.0)
+    assert gen.shadow == {0x10000000: 0x11111111}
+    assert gen.sim_lost and not gen.outstanding
+    print("✓ Failed writes leave the shadow copy untouched")
+
+
+def main():
+    print("=" * 60)
+    print("PCIe Load Generator - Offline Checks")
+    print("=" * 60)
+
+    try:
+        test_seed_reproducible()
+        test_address_bounds()
+        test_sequential_sweep()
+        test_percentile()
+        test_argument_validation()
+        test_cfg_write_needs_snapshot()
+        test_timed_out_tag_not_reused()
+        test_late_response_latency_recorded()
+        test_failed_write_leaves_shadow()
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("✅ ALL LOAD GENERATOR CHECKS PASSED")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())